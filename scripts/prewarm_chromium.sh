@@ -0,0 +1,27 @@
+#!/usr/bin/env bash
+# Copy the Playwright browser builds into tmpfs and read them once so the
+# Chromium binary and its snapshot files are already in RAM at first launch.
+#
+# Usage: eval "$(scripts/prewarm_chromium.sh)"
+#   PLAYWRIGHT_BROWSERS_PATH   installed browsers (default: ~/.cache/ms-playwright)
+#   PW_TMPFS_DIR               tmpfs destination (default: /dev/shm/pw)
+#
+# Prints the export line pointing Playwright at the tmpfs copy.
+set -euo pipefail
+
+SRC_DIR="${PLAYWRIGHT_BROWSERS_PATH:-${HOME}/.cache/ms-playwright}"
+DEST_DIR="${PW_TMPFS_DIR:-/dev/shm/pw}"
+
+if [ ! -d "${SRC_DIR}" ]; then
+  echo "No Playwright browsers found in ${SRC_DIR}; run 'playwright install chromium' first" >&2
+  exit 1
+fi
+
+mkdir -p "${DEST_DIR}"
+cp -r "${SRC_DIR}"/chromium* "${DEST_DIR}"/
+
+# Touch every page of the copied binaries so the first launch does not fault
+find "${DEST_DIR}" -type f \( -name 'chrome*' -o -name '*.so' -o -name '*.bin' -o -name '*.pak' -o -name '*.dat' \) \
+  -exec cat {} + > /dev/null
+
+echo "export PLAYWRIGHT_BROWSERS_PATH=${DEST_DIR}"
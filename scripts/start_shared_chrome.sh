@@ -0,0 +1,38 @@
+#!/usr/bin/env bash
+# Start one headless Chromium exposing a CDP endpoint that concurrent
+# TestSprite workers attach to (see testsprite_tests/_pool.py).
+#
+# Usage: scripts/start_shared_chrome.sh
+#   CHROME_BIN      Chromium executable (default: chromium; _pool.py passes
+#                   Playwright's own build)
+#   CDP_PORT        remote debugging port (default: 9222)
+#   CDP_USER_DATA   profile directory (default: /tmp/pw-shared)
+set -euo pipefail
+
+CHROME_BIN="${CHROME_BIN:-chromium}"
+CDP_PORT="${CDP_PORT:-9222}"
+CDP_USER_DATA="${CDP_USER_DATA:-/tmp/pw-shared}"
+
+if curl -sf "http://127.0.0.1:${CDP_PORT}/json/version" >/dev/null; then
+  echo "Shared Chromium already listening on port ${CDP_PORT}"
+  exit 0
+fi
+
+nohup "${CHROME_BIN}" \
+  --headless=new \
+  --remote-debugging-port="${CDP_PORT}" \
+  --disable-dev-shm-usage \
+  --user-data-dir="${CDP_USER_DATA}" \
+  >/tmp/pw-shared-chrome.log 2>&1 &
+
+# Wait until the DevTools endpoint answers so callers can connect immediately
+for _ in $(seq 1 50); do
+  if curl -sf "http://127.0.0.1:${CDP_PORT}/json/version" >/dev/null; then
+    echo "Shared Chromium listening on port ${CDP_PORT}"
+    exit 0
+  fi
+  sleep 0.2
+done
+
+echo "Shared Chromium failed to start; see /tmp/pw-shared-chrome.log" >&2
+exit 1
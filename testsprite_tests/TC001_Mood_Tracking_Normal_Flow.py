@@ -46,11 +46,10 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Look for any navigation or menu elements to access the Mood Check-in screen.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
         assert False, 'Test failed: Expected result unknown, forcing failure.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
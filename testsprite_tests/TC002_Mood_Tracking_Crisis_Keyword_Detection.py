@@ -46,11 +46,11 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Find and navigate to the Mood Check-in screen by locating any relevant navigation elements or buttons.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
         # Try to find any navigation or menu elements by scrolling up or searching for text related to Mood Check-in.
-        await page.mouse.wheel(0, -window.innerHeight)
+        await page.evaluate("window.scrollBy(0, -window.innerHeight)")
         
 
         # Try to reload the page or open a different tab to find the Mood Check-in screen or any navigation options.
@@ -62,12 +62,11 @@ async def run_test():
         
 
         # Try to find any hidden or off-screen elements by scrolling down or searching for text related to mood check-in.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
         # Generic failing assertion since expected result is unknown
         assert False, 'Test plan execution failed: crisis overlay did not appear as expected.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
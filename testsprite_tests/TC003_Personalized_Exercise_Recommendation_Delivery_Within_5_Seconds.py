@@ -46,7 +46,7 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Locate and navigate to the mood check-in screen or start the mood check-in process.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
         # Try to reload the page to see if the mood check-in elements appear or find any navigation elements to start mood check-in.
@@ -54,11 +54,10 @@ async def run_test():
         
 
         # Try to find any hidden menus, buttons, or navigation elements by scrolling or searching for text related to mood check-in or exercises.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
         assert False, 'Test plan execution failed: Expected personalized exercise recommendation not verified.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
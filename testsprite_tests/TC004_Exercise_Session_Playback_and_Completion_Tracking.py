@@ -46,7 +46,7 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Try to find a way to navigate to the Exercise Library, possibly by scrolling or searching for navigation elements.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
         # Try to reload the page or open a new tab to find the Exercise Library or related navigation.
@@ -54,7 +54,6 @@ async def run_test():
         
 
         assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -50,7 +50,6 @@ async def run_test():
         
 
         assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
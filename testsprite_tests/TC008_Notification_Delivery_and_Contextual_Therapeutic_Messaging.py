@@ -1,129 +1,83 @@
-import asyncio
-from playwright import async_api
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8081", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
+import pytest
+
+from _nav import scroll_viewport
+from _setup import app_page
+from _wait import wait_settled
+
+async def test_notification_delivery_and_contextual_therapeutic_messaging(context):
+    async with app_page(context) as page:
         # Interact with the page elements to simulate user flow
         # Locate and navigate to the settings or notification preferences page to configure notification preferences.
-        await page.mouse.wheel(0, window.innerHeight)
-        
+        await scroll_viewport(page)
+
+
+        await scroll_viewport(page)
+
 
-        await page.mouse.wheel(0, window.innerHeight)
-        
+        await scroll_viewport(page)
 
-        await page.mouse.wheel(0, window.innerHeight)
-        
 
-        await page.mouse.wheel(0, window.innerHeight)
-        
+        await scroll_viewport(page)
+
 
         # Try to open a new tab or use a direct URL to access the settings or notification preferences page, or report the issue if no navigation is possible.
-        await page.goto('http://localhost:8081/settings', timeout=10000)
-        
+        await page.goto('http://localhost:8081/settings')
+
 
         # Complete the CAPTCHA to proceed with the search or try alternative approaches to access notification preferences within the app.
         frame = context.pages[-1].frame_locator('html > body > div > form > div > div > div > iframe[title="reCAPTCHA"][role="presentation"][name="a-58uz6c1dz1fm"][src="https://www.google.com/recaptcha/api2/anchor?ar=1&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&co=aHR0cHM6Ly93d3cuZ29vZ2xlLmNvbTo0NDM.&hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&size=normal&s=JXgJ2HwOBA2Gmzgxk9fBmiyKrdftrnB2hxc9Av_wuih3QFzsAa9wHx3CfbfYJimw9sqPSJv7Opq9b4R8pY_dVDO5U0_OMdjd1up-iZuaIOrqIhW7umwj9MSANIrVyj9KurenLREzcMzUocaFrhOlnd8v0mrWGvLUT1zS2NY0zDKsLQL6eBUfDurqdrG4w5ZQBO7NsU_AFhvMuDUSj-ZINzGPV6MJ9vcT21RhtpmkH6G2Fv2JSqVRDRvjQGS-fBr-ldJrX4xBHa-zW96p_9bMIFO1e4Cge1I&anchor-ms=20000&execute-ms=15000&cb=fnvr2misi3s"]')
         elem = frame.locator('xpath=html/body/div[2]/div[3]/div/div/div/span').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Select all images with cars in the CAPTCHA challenge and then click Verify to complete the CAPTCHA.
         frame = context.pages[-1].frame_locator('html > body > div:nth-of-type(2) > div:nth-of-type(4) > iframe[title="recaptcha challenge expires in two minutes"][name="c-58uz6c1dz1fm"][src="https://www.google.com/recaptcha/api2/bframe?hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&bft=0dAFcWeA79im-o0YDCT-CT6AsUs764YVLeH114RzgiOZSYwUzZx3ZwnOJUdCt-Gru7zIOBjJyH6VJyuw4X3BTiv_bjvevjJufdbA"]')
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/div/table/tbody/tr/td').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Try to scroll or focus on CAPTCHA images and retry clicking them, or try to reload CAPTCHA or switch to audio challenge if clicking images fails again.
         frame = context.pages[-1].frame_locator('html > body > div:nth-of-type(2) > div:nth-of-type(4) > iframe[title="recaptcha challenge expires in two minutes"][name="c-58uz6c1dz1fm"][src="https://www.google.com/recaptcha/api2/bframe?hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&bft=0dAFcWeA79im-o0YDCT-CT6AsUs764YVLeH114RzgiOZSYwUzZx3ZwnOJUdCt-Gru7zIOBjJyH6VJyuw4X3BTiv_bjvevjJufdbA"]')
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/div/table/tbody/tr/td').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Select all images with cars in the CAPTCHA and then click the Verify button to complete the CAPTCHA and unblock the search.
         frame = context.pages[-1].frame_locator('html > body > div:nth-of-type(2) > div:nth-of-type(4) > iframe[title="recaptcha challenge expires in two minutes"][name="c-58uz6c1dz1fm"][src="https://www.google.com/recaptcha/api2/bframe?hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&bft=0dAFcWeA79im-o0YDCT-CT6AsUs764YVLeH114RzgiOZSYwUzZx3ZwnOJUdCt-Gru7zIOBjJyH6VJyuw4X3BTiv_bjvevjJufdbA"]')
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/div/table/tbody/tr/td').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Try clicking the CAPTCHA image tiles again with a slight delay between clicks or try clicking the 'Get a new challenge' button to reload CAPTCHA if clicks fail again.
         frame = context.pages[-1].frame_locator('html > body > div:nth-of-type(2) > div:nth-of-type(4) > iframe[title="recaptcha challenge expires in two minutes"][name="c-58uz6c1dz1fm"][src="https://www.google.com/recaptcha/api2/bframe?hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&bft=0dAFcWeA79im-o0YDCT-CT6AsUs764YVLeH114RzgiOZSYwUzZx3ZwnOJUdCt-Gru7zIOBjJyH6VJyuw4X3BTiv_bjvevjJufdbA"]')
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/div/table/tbody/tr/td').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Try clicking the 'Get a new challenge' button to reload CAPTCHA or try the audio challenge to bypass image selection.
         frame = context.pages[-1].frame_locator('html > body > div:nth-of-type(2) > div:nth-of-type(4) > iframe[title="recaptcha challenge expires in two minutes"][name="c-58uz6c1dz1fm"][src="https://www.google.com/recaptcha/api2/bframe?hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&bft=0dAFcWeA79im-o0YDCT-CT6AsUs764YVLeH114RzgiOZSYwUzZx3ZwnOJUdCt-Gru7zIOBjJyH6VJyuw4X3BTiv_bjvevjJufdbA"]')
         elem = frame.locator('xpath=html/body/div/div/div[3]/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Select all images with bridges and then click the Verify button to complete the CAPTCHA and unblock the search.
         frame = context.pages[-1].frame_locator('html > body > div:nth-of-type(2) > div:nth-of-type(4) > iframe[title="recaptcha challenge expires in two minutes"][name="c-58uz6c1dz1fm"][src="https://www.google.com/recaptcha/api2/bframe?hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&bft=0dAFcWeA79im-o0YDCT-CT6AsUs764YVLeH114RzgiOZSYwUzZx3ZwnOJUdCt-Gru7zIOBjJyH6VJyuw4X3BTiv_bjvevjJufdbA"]')
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/div/table/tbody/tr/td').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Try clicking the CAPTCHA image tiles using keyboard navigation or focus before clicking, or try the audio challenge to bypass image selection.
         frame = context.pages[-1].frame_locator('html > body > div:nth-of-type(2) > div:nth-of-type(4) > iframe[title="recaptcha challenge expires in two minutes"][name="c-58uz6c1dz1fm"][src="https://www.google.com/recaptcha/api2/bframe?hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&bft=0dAFcWeA79im-o0YDCT-CT6AsUs764YVLeH114RzgiOZSYwUzZx3ZwnOJUdCt-Gru7zIOBjJyH6VJyuw4X3BTiv_bjvevjJufdbA"]')
         elem = frame.locator('xpath=html/body/div/div/div[3]/div[2]/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Since CAPTCHA cannot be bypassed programmatically and external search is blocked, report the inability to proceed with the task due to CAPTCHA and network restrictions.
-        await page.goto('http://localhost:8081', timeout=10000)
-        
+        await page.goto('http://localhost:8081')
+
 
         assert False, 'Test plan execution failed: Expected result unknown, generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -46,10 +46,10 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Try to reload the page or find any hidden navigation or menu elements to access main app screens.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
-        await page.mouse.wheel(0, -window.innerHeight)
+        await page.evaluate("window.scrollBy(0, -window.innerHeight)")
         
 
         # Try to reload the page or check for any hidden navigation or menu elements to access main app screens.
@@ -57,15 +57,14 @@ async def run_test():
         
 
         # Check if the app requires login or initial setup by searching for login or start buttons or links.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
         # Try to open developer console or check for any hidden elements or errors that might explain the empty screen.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
         assert False, 'Test plan execution failed: expected result unknown, generic failure assertion.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -46,7 +46,7 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Find a way to start mood check-ins or navigate to mood tracking to begin data entry.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
         # Try to reload the page or open a new tab to see if the UI loads properly or if there is an alternative entry point.
@@ -66,7 +66,6 @@ async def run_test():
         
 
         assert False, 'Test plan execution failed: Unable to verify insights screen due to unknown expected results.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,96 +1,33 @@
-import asyncio
-from playwright import async_api
+import pytest
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8081", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
+from _nav import probe_paths, scroll_viewport, spa_goto
+from _setup import app_page
+
+async def test_settings_privacy_and_data_management_controls(context):
+    async with app_page(context) as page:
         # Interact with the page elements to simulate user flow
         # Look for any navigation or menu elements by scrolling or refreshing to find access to Settings screen.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Try to reload the page or open a different tab or URL to find the Settings screen or navigation.
-        await page.goto('http://localhost:8081/', timeout=10000)
-        
-
-        # Since automated search is blocked, try to navigate back to the app main page and attempt to find Settings screen by exploring common UI elements or URLs.
-        await page.goto('http://localhost:8081', timeout=10000)
-        
-
-        # Try to open a new tab or try common URL paths for settings like /settings, /user/settings, /profile/settings to find the Settings screen.
-        await page.goto('http://localhost:8081/settings', timeout=10000)
-        
+        await scroll_viewport(page)
 
-        # Try common alternative URLs for settings like /user/settings, /profile/settings or try to find a menu or button on the main page to access settings.
-        await page.goto('http://localhost:8081/user/settings', timeout=10000)
-        
 
-        # Try to find a menu or button on the main page or other common URLs like /profile/settings or /account/settings to access settings UI.
-        await page.goto('http://localhost:8081/profile/settings', timeout=10000)
-        
+        # Probe common URL paths for settings like /settings, /user/settings, /profile/settings in one batch and only visit the ones the server answers successfully.
+        # The SPA server returns index.html for any path, so this only skips paths that fail outright; unknown client-side routes still get visited.
+        statuses = await probe_paths(page, ['/settings', '/user/settings', '/profile/settings', '/'])
+        for path, status in statuses.items():
+            if 200 <= status < 400:
+                await spa_goto(page, path)
 
-        # Try to navigate back to the main page and look for any visible menu, hamburger icon, or navigation elements that might lead to the Settings screen.
-        await page.goto('http://localhost:8081', timeout=10000)
-        
 
         # Try to scroll down the page fully to check for any hidden or off-screen navigation elements or menus that might lead to Settings.
-        await page.mouse.wheel(0, window.innerHeight)
-        
+        await scroll_viewport(page)
+
 
         # Since automated search is blocked, try to navigate back to the app main page and attempt to find Settings screen by exploring common UI elements or URLs.
-        await page.goto('http://localhost:8081', timeout=10000)
-        
+        await spa_goto(page, '/')
+
 
         assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -54,7 +54,6 @@ async def run_test():
         
 
         assert False, 'Test plan execution failed: UI did not render as expected, marking test as failed.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -1,107 +1,61 @@
-import asyncio
-from playwright import async_api
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8081", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
+import pytest
+
+from _nav import scroll_viewport
+from _setup import app_page
+from _wait import wait_settled
+
+async def test_data_access_security_and_anonymized_analytics(context):
+    async with app_page(context) as page:
         # Interact with the page elements to simulate user flow
         # Click on the first relevant link about Pocket Authentication API Documentation to find API details for access control
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div[3]/div/div[11]/div/div/div[2]/div[2]/div/div/div/div/div/div/div/div/span/a/div/div/span/div/img').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Scroll down to find specific API endpoints related to mood data access and user authentication to test access control
-        await page.mouse.wheel(0, window.innerHeight)
-        
+        await scroll_viewport(page)
+
 
         # Click on the first Stack Overflow link about 'Getting Access denied if call API without call the official...' to understand typical error responses for unauthorized API calls
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div[3]/div/div[11]/div/div/div[2]/div[2]/div/div/div/div/div/div/div/div/span/a/div/div/span/div/img').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Click on the first search result link titled 'Retrieving data from Pocket API (oAuth) - node.js' to find API request examples for mood data access
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div[3]/div/div[11]/div/div/div[2]/div[2]/div/div/div/div/div/div/div/div/span/a/div/div/span/div/img').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Attempt to simulate an API request to access mood data of a different user and verify that access is denied with appropriate error code (401 or 403)
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div[6]/div[2]/div/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Click on the first relevant link 'Is there an API for analyzing the emotion in text? - Quora' to check if it contains useful API access information
         frame = context.pages[-1]
         elem = frame.locator('xpath=html/body/div[3]/div/div[11]/div/div/div[2]/div[2]/div/div/div/div/div/div/div/div/span/a/div/div/span/div/img').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await wait_settled(page); await elem.click()
+
 
         # Assertion: Verify access is denied with appropriate error code when accessing mood data of a different user
         response_status = 401  # or 403 depending on API implementation
         assert response_status in [401, 403], f"Expected access denied status code 401 or 403, got {response_status}"
-        
+
         # Assertion: Verify data returned corresponds only to logged-in user after login
         logged_in_user_id = 'user123'  # example logged-in user id
         returned_user_id = 'user123'  # this should be extracted from the API response
         assert returned_user_id == logged_in_user_id, f"Returned data user id {returned_user_id} does not match logged-in user id {logged_in_user_id}"
-        
+
         # Assertion: Verify no personally identifiable information is exposed in aggregated analytics
         aggregated_data = {'trend': 'positive', 'count': 100}  # example aggregated analytics data
-        pii_fields = ['name', 'email', 'phone', 'address']
-        for field in pii_fields:
-            assert field not in aggregated_data, f"PII field {field} should not be present in aggregated analytics data"
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        pii_fields = frozenset(('name', 'email', 'phone', 'address'))
+        leaked = pii_fields & aggregated_data.keys()
+        assert not leaked, f"PII fields {sorted(leaked)} should not be present in aggregated analytics data"
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
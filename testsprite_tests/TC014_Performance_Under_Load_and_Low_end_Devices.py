@@ -1,100 +1,66 @@
-import asyncio
+import pytest
 from playwright import async_api
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+from _nav import APP_URL
+from _pool import LAUNCH_ARGS, isolated_context
+from _routes import install_blocking_routes
+from _setup import app_page
+
+PROFILE_DIR = "/dev/shm/pw-profile"
+
+# Emulate a budget Android phone: small high-DPI touch screen, slow CPU, slow 4G-class network
+LOW_END_DEVICE = {"viewport": {"width": 360, "height": 640}, "device_scale_factor": 2, "is_mobile": True, "has_touch": True}
+LOW_END_CPU_THROTTLING_RATE = 4
+LOW_END_NETWORK = {"offline": False, "latency": 150, "downloadThroughput": 1.6 * 1024 * 1024 / 8, "uploadThroughput": 750 * 1024 / 8}
+
+
+async def _throttle(page):
+    # CPU and network throttling are per page and only last while this CDP session stays attached
+    cdp = await page.context.new_cdp_session(page)
+    await cdp.send("Emulation.setCPUThrottlingRate", {"rate": LOW_END_CPU_THROTTLING_RATE})
+    await cdp.send("Network.emulateNetworkConditions", LOW_END_NETWORK)
+
+
+async def _probe(page, url):
+    # Navigate without waiting for the load event; a route that never answers is simply skipped
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
+        await page.goto(url, wait_until="commit")
+    except async_api.TimeoutError:
+        pass
+
+
+async def test_performance_under_load_and_low_end_devices(playwright_pool):
+    # Reuse a persistent profile on tmpfs so V8 code cache and HTTP cache stay warm across runs.
+    # In CDP mode this is a fresh context with the same device emulation instead;
+    # depending on ``playwright_pool`` ties the pool teardown to the session
+    async with isolated_context(APP_URL, PROFILE_DIR, args=LAUNCH_ARGS, **LOW_END_DEVICE) as context:
         context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:8081", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        # Probe navigations only need the response to start; give up on them quickly
+        context.set_default_navigation_timeout(2000)
+        await install_blocking_routes(context)
+
+        # Collect console output, uncaught page errors and failed requests as diagnostics
+        errors = []
+
+        async def prepare(page):
+            page.on("console", lambda msg: errors.append(("con", msg.type, msg.text)))
+            page.on("pageerror", lambda exc: errors.append(("err", str(exc))))
+            page.on("requestfailed", lambda request: errors.append(("net", request.url, request.failure)))
+            await _throttle(page)
+
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Try to reload the app or check for any error messages or logs that might indicate the issue.
-        await page.goto('http://localhost:8081/', timeout=10000)
-        
-
-        # Check for any console errors or logs that might indicate the cause of the loading failure or try to access any debug or developer tools available.
-        await page.goto('http://localhost:8081/debug', timeout=10000)
-        
-
-        # Since the app does not load on the low-end device emulator, try to test the app on a higher-end device or emulator to verify if the issue is specific to low-end devices or a general loading problem.
-        await page.goto('http://localhost:8081/', timeout=10000)
-        
-
-        # Check for any visible error messages, logs, or network activity that might indicate why the app is not rendering UI on any device.
-        await page.goto('http://localhost:8081/logs', timeout=10000)
-        
-
-        # Complete the CAPTCHA to continue searching or switch to alternative methods to gather information about app performance and device compatibility.
-        frame = context.pages[-1].frame_locator('html > body > div > form > div > div > div > iframe[title="reCAPTCHA"][role="presentation"][name="a-doonv518d1g5"][src="https://www.google.com/recaptcha/api2/anchor?ar=1&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&co=aHR0cHM6Ly93d3cuZ29vZ2xlLmNvbTo0NDM.&hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&size=normal&s=YsW8Jc5fITwV7kohZLU5suW9MUDhaEITZ-cbCWUaiOh-9SnG-CUiI4GLzf_lO8rpgC_4b9C1NUFGBQzr812kYkbqHEvDtN4r8zHSIgkvi-QhMvQozPMoP8k5uCiMfuh6lAy_XVsjeaIhlCn13Z86kQXGRMrO31VXOPgG4rvA34RxgFZTP6ueZHHrog1Zv4RhhgtIlzNrTyBnY-8L-TgCqoNncZIgher3SJxL-9yflhzVtL71s9xJGM-mngtjG3O-jvO5_tm4BHpSNFntJpEBNHsTXCyzXho&anchor-ms=20000&execute-ms=15000&cb=j8f3apj66o39"]')
-        elem = frame.locator('xpath=html/body/div[2]/div[3]/div/div/div/span').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Manually solve the CAPTCHA by selecting all squares with motorcycles to proceed with the search or skip if no motorcycles are visible.
-        frame = context.pages[-1].frame_locator('html > body > div:nth-of-type(2) > div:nth-of-type(4) > iframe[title="recaptcha challenge expires in two minutes"][name="c-doonv518d1g5"][src="https://www.google.com/recaptcha/api2/bframe?hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&bft=0dAFcWeA5WdLjqUcxSuYUdT2PXQZRmCAiX5ULLd9K-Mff2gjavlJzAB1iStWj9ZrBlqJ5CSPlGJmz5WK715eMgQQhLmH-zaF0uaQ"]')
-        elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/div/table/tbody/tr/td').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Since automated CAPTCHA solving failed, either skip the CAPTCHA challenge or wait for manual intervention to solve it, then continue with the search or alternative information gathering.
-        frame = context.pages[-1].frame_locator('html > body > div:nth-of-type(2) > div:nth-of-type(4) > iframe[title="recaptcha challenge expires in two minutes"][name="c-doonv518d1g5"][src="https://www.google.com/recaptcha/api2/bframe?hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&bft=0dAFcWeA5WdLjqUcxSuYUdT2PXQZRmCAiX5ULLd9K-Mff2gjavlJzAB1iStWj9ZrBlqJ5CSPlGJmz5WK715eMgQQhLmH-zaF0uaQ"]')
-        elem = frame.locator('xpath=html/body/div/div/div[3]/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Since automated CAPTCHA solving is not possible, skip the CAPTCHA again or wait for manual intervention to proceed with the search or switch to alternative information gathering methods.
-        frame = context.pages[-1].frame_locator('html > body > div:nth-of-type(2) > div:nth-of-type(4) > iframe[title="recaptcha challenge expires in two minutes"][name="c-doonv518d1g5"][src="https://www.google.com/recaptcha/api2/bframe?hl=en&v=_mscDd1KHr60EWWbt2I_ULP0&k=6LdLLIMbAAAAAIl-KLj9p1ePhM-4LCCDbjtJLqRO&bft=0dAFcWeA5WdLjqUcxSuYUdT2PXQZRmCAiX5ULLd9K-Mff2gjavlJzAB1iStWj9ZrBlqJ5CSPlGJmz5WK715eMgQQhLmH-zaF0uaQ"]')
-        elem = frame.locator('xpath=html/body/div/div/div[3]/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        assert False, 'Test plan execution failed: app did not load or respond as expected on low-end device emulator.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+            # Child frames load slowly under CPU and network throttling
+            async with app_page(context, prepare=prepare, frame_timeout_ms=1500) as page:
+                # Interact with the page elements to simulate user flow
+                # Reload the app; any errors that might indicate the issue are captured by the listeners above.
+                await _probe(page, APP_URL + '/')
+
+
+                assert False, 'Test plan execution failed: app did not load or respond as expected on low-end device emulator.'
+        except Exception as exc:
+            # Whatever step fails, report the collected diagnostics with it
+            raise AssertionError(f"{exc}\nDiagnostics: {errors}") from exc
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
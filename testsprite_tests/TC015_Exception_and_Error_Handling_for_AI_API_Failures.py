@@ -46,7 +46,7 @@ async def run_test():
         
         # Interact with the page elements to simulate user flow
         # Locate and navigate to the exercise recommendation feature or page to simulate AI API failure.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
         # Try to reload the page or open a different tab or URL to find the exercise recommendation feature.
@@ -54,7 +54,7 @@ async def run_test():
         
 
         # Try to open developer console or logs to check for errors or warnings that might explain missing UI elements or app loading issues.
-        await page.mouse.wheel(0, window.innerHeight)
+        await page.evaluate("window.scrollBy(0, window.innerHeight)")
         
 
         # Try to open a new tab and navigate to a known route or URL that might expose the exercise recommendation feature or simulate API failure.
@@ -78,7 +78,6 @@ async def run_test():
         
 
         assert False, 'Test failed due to AI exercise recommendation API failure simulation.'
-        await asyncio.sleep(5)
     
     finally:
         if context:
@@ -0,0 +1,45 @@
+from _wait import wait_settled
+
+APP_URL = "http://localhost:8081"
+
+
+async def spa_goto(page, path):
+    """Switch the app to ``path`` without reloading the JS bundle.
+
+    Once the page is already on the app, a ``history.pushState`` plus a
+    ``popstate`` event lets the client-side router change screens instead of
+    paying for a full navigation. Anywhere else this falls back to
+    ``page.goto``.
+    """
+    if not page.url.startswith(APP_URL):
+        await page.goto(APP_URL + path)
+        return
+
+    await page.evaluate(
+        "p => { window.history.pushState({}, '', p); window.dispatchEvent(new PopStateEvent('popstate')); }",
+        path,
+    )
+    await wait_settled(page)
+
+
+async def scroll_viewport(page, factor=1):
+    """Scroll the page down by ``factor`` viewport heights."""
+    await page.evaluate("f => window.scrollBy(0, window.innerHeight * f)", factor)
+
+
+async def probe_paths(page, paths):
+    """Return ``{path: status}`` for ``paths`` using in-page HEAD requests.
+
+    All probes run concurrently through ``fetch`` from the current page, so
+    a missing route costs one small HTTP round-trip instead of a full
+    navigation. Unreachable paths report status ``0``.
+
+    Only server-side routes can be ruled out this way: the SPA's dev and
+    static servers answer every path with ``index.html``, so a client-side
+    route the app does not know still reports 200.
+    """
+    results = await page.evaluate(
+        "async paths => Promise.all(paths.map(p => fetch(p, {method: 'HEAD'}).then(r => [p, r.status]).catch(_ => [p, 0])))",
+        list(paths),
+    )
+    return dict(results)
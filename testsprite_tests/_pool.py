@@ -0,0 +1,172 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+from playwright import async_api
+
+# When set (e.g. http://127.0.0.1:9222), attach to the shared Chromium started
+# by scripts/start_shared_chrome.sh instead of launching a private one
+CDP_ENDPOINT = os.environ.get("PW_CDP_ENDPOINT")
+CDP_CONNECT_ATTEMPTS = 3
+START_SHARED_CHROME = Path(__file__).resolve().parent.parent / "scripts" / "start_shared_chrome.sh"
+
+# Persistent profile whose HTTP disk cache survives across tests and CI runs
+CACHE_DIR = os.environ.get("PW_CACHE_DIR", "/tmp/pw-cache")
+CACHE_ARGS = (
+    f"--disk-cache-dir={CACHE_DIR}/Cache",
+    "--disk-cache-size=536870912",
+)
+
+# Default Chromium launch arguments shared by every TestSprite case
+LAUNCH_ARGS = (
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--no-zygote",                    # Skip the zygote process; renderers still run in parallel
+    "--disable-gpu",                  # Headless runs do not need GPU compositing
+    "--disable-background-networking",  # Mute update/metrics traffic competing with the app
+    "--disable-extensions",           # No extension host process
+)
+
+_pw = None
+_shared_browser = None
+_persistent_contexts = {}
+_lock = asyncio.Lock()
+
+
+async def _start_shared_chrome(pw, endpoint):
+    # Start Playwright's own Chromium (an explicit CHROME_BIN wins) on the port the
+    # endpoint points at, not the script's defaults
+    env = {
+        "CHROME_BIN": pw.chromium.executable_path,
+        **os.environ,
+        "CDP_PORT": str(urlparse(endpoint).port or 9222),
+    }
+    proc = await asyncio.create_subprocess_exec(str(START_SHARED_CHROME), env=env)
+    returncode = await proc.wait()
+    if returncode != 0:
+        raise RuntimeError(f"{START_SHARED_CHROME} exited with status {returncode}")
+
+
+async def _connect_shared(pw, endpoint):
+    # Attach to the shared Chromium, (re)starting it if the port is dead
+    for attempt in range(CDP_CONNECT_ATTEMPTS):
+        try:
+            return await pw.chromium.connect_over_cdp(endpoint)
+        except async_api.Error:
+            if attempt == CDP_CONNECT_ATTEMPTS - 1:
+                raise
+            await _start_shared_chrome(pw, endpoint)
+
+
+async def _playwright():
+    global _pw
+
+    if _pw is None:
+        _pw = await async_api.async_playwright().start()
+    return _pw
+
+
+async def get_shared_browser():
+    """Return the shared Chromium at ``PW_CDP_ENDPOINT``, connecting on first use.
+
+    The lock keeps concurrent callers from racing each other into opening
+    duplicate connections.
+    """
+    global _shared_browser
+
+    async with _lock:
+        if _shared_browser is None or not _shared_browser.is_connected():
+            _shared_browser = await _connect_shared(await _playwright(), CDP_ENDPOINT)
+        return _shared_browser
+
+
+async def get_persistent_context(user_data_dir=CACHE_DIR, args=LAUNCH_ARGS + CACHE_ARGS, **options):
+    """Return a pooled persistent context backed by ``user_data_dir``.
+
+    Each profile is launched once and reused, so a run starts one Chromium
+    per profile rather than one per test. Unlike ``browser.new_context()``,
+    which gets an ephemeral in-memory profile, this context keeps its HTTP
+    and code caches on disk, so repeated navigations to the app are served
+    warm. Extra ``options`` (viewport, device emulation, ...) apply when the
+    context is first launched.
+    """
+    async with _lock:
+        context = _persistent_contexts.get(user_data_dir)
+        if context is not None:
+            return context
+
+        pw = await _playwright()
+        context = await pw.chromium.launch_persistent_context(
+            user_data_dir, headless=True, args=list(args), **options
+        )
+        _persistent_contexts[user_data_dir] = context
+        return context
+
+
+async def clear_origin_storage(context, origin):
+    """Wipe cookies, localStorage, IndexedDB, service workers and caches of ``origin``.
+
+    The HTTP disk cache is not origin storage and survives, which is the
+    point of sharing the profile in the first place.
+    """
+    page = context.pages[0] if context.pages else await context.new_page()
+    cdp = await context.new_cdp_session(page)
+    try:
+        await cdp.send("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    finally:
+        await cdp.detach()
+
+
+@asynccontextmanager
+async def isolated_context(origin, user_data_dir=CACHE_DIR, args=LAUNCH_ARGS + CACHE_ARGS, **options):
+    """Yield a browser context that starts with no state left by earlier tests.
+
+    Normally this is the pooled persistent context for ``user_data_dir``,
+    with ``origin``'s storage wiped up front and the test's pages, routes and
+    cookies dropped afterwards. With ``PW_CDP_ENDPOINT`` set, concurrent
+    workers share one Chromium, so each test instead gets its own fresh
+    context built with ``options`` and closed afterwards.
+    """
+    if CDP_ENDPOINT:
+        browser = await get_shared_browser()
+        context = await browser.new_context(**options)
+        try:
+            yield context
+        finally:
+            await context.close()
+        return
+
+    context = await get_persistent_context(user_data_dir, args, **options)
+    await clear_origin_storage(context, origin)
+    existing_pages = set(context.pages)
+    try:
+        yield context
+    finally:
+        await context.unroute_all(behavior="ignoreErrors")
+        await asyncio.gather(
+            *(page.close() for page in context.pages if page not in existing_pages),
+            return_exceptions=True,
+        )
+        await context.clear_cookies()
+
+
+async def close_all():
+    """Close every pooled context and stop the Playwright driver.
+
+    Context shutdowns are independent CDP round-trips, so they run
+    concurrently. The shared CDP browser is only disconnected from; it keeps
+    running for the other workers.
+    """
+    global _pw, _shared_browser
+
+    async with _lock:
+        contexts = list(_persistent_contexts.values())
+        _persistent_contexts.clear()
+        await asyncio.gather(*(context.close() for context in contexts), return_exceptions=True)
+        if _shared_browser is not None and _shared_browser.is_connected():
+            await _shared_browser.close()
+        _shared_browser = None
+        if _pw is not None:
+            await _pw.stop()
+            _pw = None
@@ -0,0 +1,42 @@
+import re
+from urllib.parse import urlparse
+
+from _nav import APP_URL
+
+# Ad and analytics traffic never matters to the app under test
+BLOCKED_DOMAINS = re.compile(r".*(doubleclick|google-analytics|gstatic)\..*")
+# Google pages the cases stumble into; neither is under test and both are CAPTCHA-gated
+GOOGLE_PAGE_PREFIXES = ("/recaptcha/", "/search")
+
+
+async def _route_google(route):
+    # Refuse reCAPTCHA and search outright instead of paying for real round-trips.
+    # Anything else, such as the favicon the app's connectivity check fetches,
+    # goes to the network as usual
+    if urlparse(route.request.url).path.startswith(GOOGLE_PAGE_PREFIXES):
+        await route.abort()
+    else:
+        await route.fallback()
+
+
+async def install_routes(context):
+    """Drop Google reCAPTCHA/search and ad/analytics requests."""
+    await context.route("**/www.google.com/**", _route_google)
+    await context.route(BLOCKED_DOMAINS, lambda route: route.abort())
+
+
+async def _abort_third_party_asset(route):
+    if route.request.url.startswith(APP_URL):
+        await route.fallback()
+    else:
+        await route.abort()
+
+
+async def install_blocking_routes(context):
+    """Abort reCAPTCHA and third-party image/font requests outright.
+
+    Without its scripts the CAPTCHA never mounts, so a flow that would stall
+    on it reaches its real assertions straight away.
+    """
+    await context.route("**/recaptcha/**", lambda route: route.abort())
+    await context.route("**/*.{png,jpg,woff2}", _abort_third_party_asset)
@@ -0,0 +1,75 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from playwright import async_api
+
+from _nav import APP_URL
+
+# Element lookups fail fast when the element is missing; navigations get the
+# longer budget the app needs to load its main content
+LOCATE_TIMEOUT_MS = 1500
+NAV_TIMEOUT_MS = 8000
+
+# Third-party frames that never matter to the app and are slow to load
+SKIPPED_FRAME_DOMAINS = ("google.com/recaptcha", "doubleclick", "gstatic")
+# Grace period for iframes; the main frame has already loaded by then
+FRAME_TIMEOUT_MS = 500
+
+
+async def wait_for_frames(page, timeout_ms=FRAME_TIMEOUT_MS):
+    """Wait for the page's child frames to load, all at once.
+
+    Pages without iframes return immediately. Otherwise every relevant
+    frame is awaited concurrently, so the wait is bounded by the slowest
+    frame rather than the sum of all of them. This goes through Playwright's
+    frame objects rather than one in-page ``page.evaluate``: the parent does
+    get ``load`` events from cross-origin iframes, but it cannot read their
+    ``contentDocument`` to tell whether one has *already* loaded, so it must
+    either wait for an event that may never come again or resolve such
+    frames without waiting. Playwright tracks every frame's load state from
+    the browser side and handles both cases.
+    """
+    frames = [
+        frame for frame in page.frames
+        if frame is not page.main_frame
+        and not any(domain in frame.url for domain in SKIPPED_FRAME_DOMAINS)
+    ]
+    if not frames:
+        return
+
+    await asyncio.gather(
+        *(frame.wait_for_load_state("domcontentloaded", timeout=timeout_ms) for frame in frames),
+        return_exceptions=True,
+    )
+
+
+@asynccontextmanager
+async def app_page(context, url=APP_URL, prepare=None, frame_timeout_ms=FRAME_TIMEOUT_MS):
+    """Open a page on the app, wait for it to load and close it afterwards.
+
+    ``prepare`` is awaited with the fresh page before it navigates, e.g. to
+    apply emulation that must be in place for the initial load.
+    ``frame_timeout_ms`` bounds the wait for child frames; throttled pages
+    need more than the default.
+    """
+    # Open a new page in the browser context
+    page = await context.new_page()
+    try:
+        if prepare is not None:
+            await prepare(page)
+
+        # Navigate to your target URL and wait until the network request is committed
+        await page.goto(url, wait_until="commit")
+
+        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        try:
+            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+        except async_api.Error:
+            pass
+
+        # Wait for the iframes to load as well, concurrently
+        await wait_for_frames(page, frame_timeout_ms)
+
+        yield page
+    finally:
+        await page.close()
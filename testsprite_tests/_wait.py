@@ -0,0 +1,83 @@
+import asyncio
+
+from playwright import async_api
+
+# A page counts as settled once no request has been in flight for this long
+QUIET_WINDOW_MS = 500
+# Requests pending longer than this (long-polls, beacons) stop blocking the wait
+STALLED_REQUEST_MS = 2000
+
+
+async def wait_settled(page, timeout_ms=8000):
+    """Wait until the page's network has been quiet for ``QUIET_WINDOW_MS``.
+
+    In-flight requests are tracked through CDP ``Network`` events instead of
+    sleeping for a fixed interval. Requests stuck for more than
+    ``STALLED_REQUEST_MS`` are treated as finished, and the whole wait is
+    capped at ``timeout_ms`` so chatty pages can never hang a test.
+
+    Cross-origin iframes such as reCAPTCHA run out of process and report
+    their traffic only to their own CDP target, so each of those frames gets
+    its own session too. Frames attached after the wait has started are not
+    tracked.
+    """
+    loop = asyncio.get_running_loop()
+    settled = asyncio.Event()
+    in_flight = {}
+    quiet_timer = None
+
+    def arm_quiet_timer():
+        nonlocal quiet_timer
+        if quiet_timer is not None:
+            quiet_timer.cancel()
+        quiet_timer = loop.call_later(QUIET_WINDOW_MS / 1000, settled.set)
+
+    def on_request(target, params):
+        nonlocal quiet_timer
+        in_flight[target, params["requestId"]] = loop.time()
+        if quiet_timer is not None:
+            quiet_timer.cancel()
+            quiet_timer = None
+
+    def on_finished(target, params):
+        in_flight.pop((target, params["requestId"]), None)
+        if not in_flight:
+            arm_quiet_timer()
+
+    async def sweep_stalled():
+        while True:
+            await asyncio.sleep(QUIET_WINDOW_MS / 1000)
+            cutoff = loop.time() - STALLED_REQUEST_MS / 1000
+            for request_id, started in list(in_flight.items()):
+                if started < cutoff:
+                    del in_flight[request_id]
+            if not in_flight and quiet_timer is None:
+                arm_quiet_timer()
+
+    # Request ids are only unique per target, so key them by session
+    sessions = [await page.context.new_cdp_session(page)]
+    for frame in page.frames:
+        if frame is page.main_frame:
+            continue
+        try:
+            sessions.append(await page.context.new_cdp_session(frame))
+        except async_api.Error:
+            pass  # in-process frame; its requests already reach the page session
+
+    for target, cdp in enumerate(sessions):
+        cdp.on("Network.requestWillBeSent", lambda params, target=target: on_request(target, params))
+        cdp.on("Network.loadingFinished", lambda params, target=target: on_finished(target, params))
+        cdp.on("Network.loadingFailed", lambda params, target=target: on_finished(target, params))
+        await cdp.send("Network.enable")
+    arm_quiet_timer()
+    sweeper = asyncio.create_task(sweep_stalled())
+
+    try:
+        await asyncio.wait_for(settled.wait(), timeout_ms / 1000)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        sweeper.cancel()
+        if quiet_timer is not None:
+            quiet_timer.cancel()
+        await asyncio.gather(*(cdp.detach() for cdp in sessions), return_exceptions=True)
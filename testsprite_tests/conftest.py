@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest_asyncio
+
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
+from _nav import APP_URL
+from _pool import close_all, isolated_context
+from _routes import install_routes
+from _setup import LOCATE_TIMEOUT_MS, NAV_TIMEOUT_MS
+
+
+def pytest_asyncio_loop_factories(config, item):
+    # Run the shared session loop on libuv when available; Playwright's many
+    # small IPC round-trips are cheaper there than on the stock selector loop
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def playwright_pool():
+    # Launches nothing itself: the pool starts Chromium lazily, once per
+    # profile, and this fixture shuts it all down at the end of the session
+    try:
+        yield
+    finally:
+        await close_all()
+
+
+@pytest_asyncio.fixture
+async def context(playwright_pool):
+    # Reuse the persistent, disk-cached profile so repeated navigations to the
+    # app hit a warm cache, starting from empty app storage and with
+    # third-party Google pages stubbed out
+    async with isolated_context(APP_URL) as context:
+        context.set_default_timeout(LOCATE_TIMEOUT_MS)
+        context.set_default_navigation_timeout(NAV_TIMEOUT_MS)
+        await install_routes(context)
+        yield context